@@ -0,0 +1,188 @@
+import math
+import sqlite3
+import threading
+import time
+from functools import wraps
+
+from flask import jsonify
+
+
+class Overloaded(Exception):
+    """Raised when a request is shed; carries the status and Retry-After to send"""
+
+    def __init__(self, status, retry_after, msg):
+        super().__init__(msg)
+        self.status = status
+        self.retry_after = retry_after
+        self.msg = msg
+
+
+def overloaded_response(e):
+    return jsonify({"msg": e.msg}), e.status, {'Retry-After': str(e.retry_after)}
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `burst`; one token per request"""
+
+    def __init__(self, name, rate, burst, store=None):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.store = store
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, tokens, updated, now):
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def take(self):
+        """Take a token; returns 0 if admitted, else seconds until one is available"""
+        if self.store:
+            return self._take_shared()
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = self._refill(self._tokens, self._updated, now)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def _take_shared(self):
+        # Bucket state lives in a local SQLite file so every worker process
+        # on the machine draws from the same bucket
+        conn = sqlite3.connect(self.store, timeout=5, isolation_level=None)
+        try:
+            conn.execute('CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL, updated REAL)')
+            conn.execute('BEGIN IMMEDIATE')
+            now = time.time()
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE name = ?', (self.name,)).fetchone()
+            tokens = self._refill(*row, now) if row else self.burst
+
+            wait = 0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+            conn.execute('INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)',
+                         (self.name, tokens, now))
+            conn.execute('COMMIT')
+            return wait
+        finally:
+            conn.close()
+
+
+class SingleFlight:
+    """Runs one computation per key at a time and shares its result with
+    every caller that asks for the same key while it is running"""
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AdmissionControl:
+    """Sheds load on expensive read endpoints so score writes keep a thread.
+
+    Each guarded endpoint has a token bucket (ADMISSION_RATE per second,
+    ADMISSION_BURST deep) answered with 429 when empty. At most
+    ADMISSION_MAX_INFLIGHT guarded requests are served at once and at most
+    ADMISSION_MAX_COMPUTE of them compute; the rest get 503. Identical
+    requests that arrive while a computation is running wait for it and
+    share its result instead of computing again. Score writes are never
+    guarded, so keeping ADMISSION_MAX_INFLIGHT below the server's thread
+    count leaves threads free for them.
+    """
+
+    def __init__(self, app):
+        config = app.config
+        self.rate = config['ADMISSION_RATE']
+        self.burst = config['ADMISSION_BURST']
+        self.store = config.get('ADMISSION_STORE')
+        self.retry_after = config['ADMISSION_RETRY_AFTER']
+        self.inflight = threading.BoundedSemaphore(config['ADMISSION_MAX_INFLIGHT'])
+        self.compute = threading.BoundedSemaphore(config['ADMISSION_MAX_COMPUTE'])
+        self.flights = SingleFlight()
+        self.buckets = {}
+
+    def guard(self, name, authorize=None):
+        """Rate limit and cap concurrency for a view; apply below @jwt_required.
+
+        When authorize() is false or fails the view runs unguarded so it can
+        refuse the caller itself, without spending a token or an in-flight slot.
+        """
+        bucket = self.buckets[name] = TokenBucket(name, self.rate, self.burst, self.store)
+
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if authorize is not None:
+                    try:
+                        allowed = authorize()
+                    except Exception:
+                        allowed = False
+                    if not allowed:
+                        return view(*args, **kwargs)
+
+                wait = bucket.take()
+                if wait:
+                    return overloaded_response(Overloaded(
+                        429, math.ceil(wait), "Too many requests, please retry shortly"
+                    ))
+
+                if not self.inflight.acquire(blocking=False):
+                    return overloaded_response(Overloaded(
+                        503, self.retry_after, "Server is busy, please retry shortly"
+                    ))
+                try:
+                    return view(*args, **kwargs)
+                finally:
+                    self.inflight.release()
+            return wrapper
+        return decorator
+
+    def run(self, key, fn):
+        """Compute fn() once for all concurrent callers with the same key.
+
+        Raises Overloaded if no compute slot is free.
+        """
+        def compute():
+            if not self.compute.acquire(blocking=False):
+                raise Overloaded(503, self.retry_after, "Server is busy, please retry shortly")
+            try:
+                return fn()
+            finally:
+                self.compute.release()
+        return self.flights.do(key, compute)
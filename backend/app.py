@@ -1,15 +1,30 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, send_file, url_for
 from flask_cors import CORS
 from flask_jwt_extended import (
     JWTManager, jwt_required, create_access_token,
     get_jwt_identity, get_jwt
 )
 from werkzeug.security import generate_password_hash
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 import os
 
-from models import db, User, Team, Criteria, Score
+from models import (
+    db, user_criteria, change_counter, CHANGE_CURSOR, RESET_CURSOR,
+    read_change_cursor, reset_change_cursor, User, Team, Criteria, Score
+)
 from config import config
+from read_replicas import ReadReplicaRouter
+from reports import ReportJob, load_status
+from admission import AdmissionControl, Overloaded, overloaded_response
+from leaderboard import SNAPSHOT_NAME, LeaderboardPublisher
+from read_models import fetch_teams, fetch_judge_scores, fetch_users, fetch_results
+from backups import (
+    BACKUP_NAME, BackupScheduler, backup_lock, create_backup, list_backups, restore_backup
+)
+from score_log import (
+    score_event, backfill_events, create_checkpoint, maybe_checkpoint,
+    state_at, baseline_at, results_from_state
+)
 
 def create_app(config_name='default'):
     app = Flask(__name__)
@@ -19,13 +34,20 @@ def create_app(config_name='default'):
     db.init_app(app)
     CORS(app)
     jwt = JWTManager(app)
+    ReadReplicaRouter(db, app)
+    admission = AdmissionControl(app)
+    
+    def current_user_is_admin():
+        # Session identity map makes the view's own lookup free afterwards
+        current_user = User.query.get(get_jwt_identity())
+        return current_user is not None and current_user.is_admin
     
     # Create database tables and run migrations
     with app.app_context():
         from sqlalchemy import text, inspect
         
-        # Create tables if they don't exist
-        db.create_all()
+        # Create tables if they don't exist (on the primary only, never on replicas)
+        db.create_all(bind_key=None)
         
         # Auto-migration: Add weight_percentage column if it doesn't exist
         try:
@@ -49,6 +71,45 @@ def create_app(config_name='default'):
             print(f"Migration check: {e}")
             db.session.rollback()
         
+        # Auto-migration: Add change tracking columns used by /api/sync
+        try:
+            inspector = inspect(db.engine)
+            for table in ('users', 'teams', 'criterias', 'scores'):
+                columns = [col['name'] for col in inspector.get_columns(table)]
+                
+                if 'change_seq' not in columns:
+                    print(f"Running migration: Adding change tracking columns to {table}...")
+                    db.session.execute(text(f"""
+                        ALTER TABLE {table} 
+                        ADD COLUMN change_seq INTEGER DEFAULT 0;
+                    """))
+                    db.session.execute(text(f"""
+                        ALTER TABLE {table} 
+                        ADD COLUMN updated_at TIMESTAMP;
+                    """))
+                    db.session.execute(text(f"""
+                        CREATE INDEX IF NOT EXISTS ix_{table}_change_seq 
+                        ON {table} (change_seq);
+                    """))
+                    db.session.commit()
+                    print(f"✓ Migration complete: change tracking columns added to {table}")
+            
+            if read_change_cursor(db.session) is None:
+                db.session.execute(change_counter.insert().values(id=CHANGE_CURSOR, value=0))
+                db.session.commit()
+        except Exception as e:
+            print(f"Migration check: {e}")
+            db.session.rollback()
+        
+        # Seed the score event log for databases created before it existed
+        try:
+            backfilled = backfill_events()
+            if backfilled:
+                print(f"✓ Score event log seeded with {backfilled} existing scores")
+        except Exception as e:
+            print(f"Score event backfill: {e}")
+            db.session.rollback()
+        
         # Create admin user if not exists
         if not User.query.filter_by(username='matoke').first():
             admin = User(
@@ -60,6 +121,9 @@ def create_app(config_name='default'):
             db.session.commit()
             print("✓ Admin user created: matoke / Matookee24")
     
+    if app.config['BACKUP_INTERVAL_MINUTES'] > 0:
+        BackupScheduler(app, db, app.config['BACKUP_INTERVAL_MINUTES']).start()
+    
     # Auth routes
     @app.route('/api/auth/register', methods=['POST'])
     @jwt_required()
@@ -124,13 +188,13 @@ def create_app(config_name='default'):
             if not current_user.is_admin:
                 return jsonify({"msg": "Admin access required"}), 403
                 
-            users = User.query.all()
+            users, assigned = fetch_users()
             return jsonify([{
                 'id': u.id,
                 'username': u.username,
                 'is_admin': u.is_admin,
                 'created_at': u.created_at.isoformat() if u.created_at else None,
-                'assigned_criteria': [c.id for c in u.assigned_criteria] if not u.is_admin else []
+                'assigned_criteria': assigned.get(u.id, []) if not u.is_admin else []
             } for u in users])
         except Exception as e:
             print(f"Error in get_users: {str(e)}")
@@ -219,8 +283,15 @@ def create_app(config_name='default'):
                 
             user = User.query.get_or_404(id)
             
+            scores = Score.query.filter_by(judge_id=id).all()
             Score.query.filter_by(judge_id=id).delete()
             db.session.delete(user)
+            # Added last so they are inserted in the commit's flush, after the
+            # user delete has taken the change counter lock; event ids then
+            # commit in order, which checkpoints rely on
+            db.session.add_all([
+                score_event('delete', s, previous_score=s.score) for s in scores
+            ])
             db.session.commit()
             
             return jsonify({"msg": "User deleted successfully"})
@@ -406,7 +477,7 @@ def create_app(config_name='default'):
     @jwt_required()
     def get_teams():
         try:
-            teams = Team.query.all()
+            teams = fetch_teams()
             return jsonify([{
                 'id': t.id,
                 'name': t.name,
@@ -489,8 +560,15 @@ def create_app(config_name='default'):
                 
             team = Team.query.get_or_404(id)
             
+            scores = Score.query.filter_by(team_id=id).all()
             Score.query.filter_by(team_id=id).delete()
             db.session.delete(team)
+            # Added last so they are inserted in the commit's flush, after the
+            # team delete has taken the change counter lock; event ids then
+            # commit in order, which checkpoints rely on
+            db.session.add_all([
+                score_event('delete', s, previous_score=s.score) for s in scores
+            ])
             db.session.commit()
             
             return jsonify({"msg": "Team deleted successfully"})
@@ -517,9 +595,12 @@ def create_app(config_name='default'):
             ).first()
             
             if existing_score:
+                previous_score = existing_score.score
                 existing_score.score = float(data['score'])
                 existing_score.notes = data.get('notes', '')
+                db.session.add(score_event('update', existing_score, previous_score))
                 db.session.commit()
+                maybe_checkpoint(app.config['SCORE_CHECKPOINT_INTERVAL'])
                 return jsonify({"msg": "Score updated successfully"})
             else:
                 score = Score(
@@ -530,7 +611,9 @@ def create_app(config_name='default'):
                     notes=data.get('notes', '')
                 )
                 db.session.add(score)
+                db.session.add(score_event('create', score))
                 db.session.commit()
+                maybe_checkpoint(app.config['SCORE_CHECKPOINT_INTERVAL'])
                 return jsonify({"msg": "Score submitted successfully"}), 201
         except Exception as e:
             db.session.rollback()
@@ -539,6 +622,7 @@ def create_app(config_name='default'):
             
     def submit_scores_batch(judge_id, scores_data):
         try:
+            events = []
             for score_data in scores_data:
                 existing_score = Score.query.filter_by(
                     judge_id=judge_id,
@@ -547,8 +631,10 @@ def create_app(config_name='default'):
                 ).first()
                 
                 if existing_score:
+                    previous_score = existing_score.score
                     existing_score.score = float(score_data['score'])
                     existing_score.notes = score_data.get('notes', '')
+                    events.append(score_event('update', existing_score, previous_score))
                 else:
                     score = Score(
                         judge_id=judge_id,
@@ -558,8 +644,11 @@ def create_app(config_name='default'):
                         notes=score_data.get('notes', '')
                     )
                     db.session.add(score)
+                    events.append(score_event('create', score))
             
+            db.session.add_all(events)
             db.session.commit()
+            maybe_checkpoint(app.config['SCORE_CHECKPOINT_INTERVAL'])
             return jsonify({"msg": "Scores submitted successfully"}), 201
             
         except Exception as e:
@@ -572,7 +661,7 @@ def create_app(config_name='default'):
     def get_my_scores():
         try:
             current_user_id = get_jwt_identity()
-            scores = Score.query.filter_by(judge_id=current_user_id).all()
+            scores = fetch_judge_scores(current_user_id)
             return jsonify([{
                 'id': s.id,
                 'team_id': s.team_id,
@@ -601,10 +690,163 @@ def create_app(config_name='default'):
         except Exception as e:
             print(f"Error in get_team_scores: {str(e)}")
             return jsonify({"msg": f"Error fetching team scores: {str(e)}"}), 500
-    
+
+    # Sync route
+    @app.route('/api/sync', methods=['GET'])
+    @jwt_required()
+    def sync():
+        """Teams, criteria and the caller's scores changed since ?since=<cursor>.
+
+        Omit since (or pass 0) for a full download. Clients store the returned
+        cursor and send it back on the next call. When reset is true the
+        database was restored since that cursor and the response is a full
+        download, so clients must replace their cache rather than merge.
+        Criteria are returned even when deactivated so clients can drop them,
+        and team_ids lists every current team so hard-deleted teams (and their
+        scores) can be pruned.
+        """
+        try:
+            current_user_id = get_jwt_identity()
+            
+            try:
+                since = int(request.args.get('since', 0))
+            except ValueError:
+                return jsonify({"msg": "Query parameter 'since' must be an integer cursor"}), 400
+            
+            # Read the cursor first: rows committed while this request runs
+            # are picked up again next time rather than skipped
+            cursor = read_change_cursor(db.session)
+            
+            # A cursor from before the last restore, or from a counter the
+            # restore rolled back, can no longer be trusted
+            reset = bool(since) and (since < (read_change_cursor(db.session, RESET_CURSOR) or 0)
+                                     or since > cursor)
+            if reset:
+                since = 0
+            
+            teams = Team.query.filter(Team.change_seq > since).all() if since else Team.query.all()
+            criterias = Criteria.query.filter(Criteria.change_seq > since).all() if since else Criteria.query.all()
+            scores = Score.query.filter(Score.judge_id == current_user_id)
+            if since:
+                scores = scores.filter(Score.change_seq > since)
+            scores = scores.all()
+            team_ids = [row.id for row in db.session.execute(db.select(Team.id))]
+            
+            return jsonify({
+                'cursor': cursor,
+                'reset': reset,
+                'teams': [{
+                    'id': t.id,
+                    'name': t.name,
+                    'description': t.description,
+                    'created_at': t.created_at.isoformat()
+                } for t in teams],
+                'criteria': [{
+                    'id': c.id,
+                    'name': c.name,
+                    'description': c.description,
+                    'max_score': c.max_score,
+                    'weight_percentage': c.weight_percentage,
+                    'is_active': c.is_active
+                } for c in criterias],
+                'scores': [{
+                    'id': s.id,
+                    'team_id': s.team_id,
+                    'criteria_id': s.criteria_id,
+                    'score': s.score,
+                    'notes': s.notes
+                } for s in scores],
+                'team_ids': team_ids
+            })
+        except Exception as e:
+            print(f"Error in sync: {str(e)}")
+            return jsonify({"msg": f"Error syncing: {str(e)}"}), 500
+
+    # Judge sheet route
+    @app.route('/api/judge/sheet', methods=['GET'])
+    @jwt_required()
+    def get_judge_sheet():
+        """Everything the judging pages need in one response.
+
+        Returns the judge's assigned criteria (all active criteria when none
+        are assigned), the teams to score and the judge's existing scores
+        indexed as scores[team_id][criteria_id]. Uses a fixed number of
+        queries regardless of how many teams or criteria exist.
+        """
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+
+            # Only judges with no assignments at all see every criterion; a
+            # judge whose assigned criteria were all deactivated sees none
+            has_assignments = not current_user.is_admin and db.session.execute(
+                db.select(user_criteria.c.criteria_id)
+                .where(user_criteria.c.user_id == current_user.id)
+                .limit(1)
+            ).first() is not None
+
+            if has_assignments:
+                criterias = Criteria.query.join(
+                    user_criteria, user_criteria.c.criteria_id == Criteria.id
+                ).filter(
+                    user_criteria.c.user_id == current_user.id,
+                    Criteria.is_active == True
+                ).order_by(Criteria.id).all()
+            else:
+                criterias = Criteria.query.filter_by(is_active=True).order_by(Criteria.id).all()
+
+            teams = Team.query.order_by(Team.id).all()
+
+            # Join the criteria details so scores against criteria that are no
+            # longer assigned can still be labelled without another request
+            score_rows = db.session.query(
+                Score, Criteria.name, Criteria.max_score, Criteria.is_active
+            ).join(
+                Criteria, Score.criteria_id == Criteria.id
+            ).filter(Score.judge_id == current_user.id).all()
+
+            scores = {}
+            for s, criteria_name, criteria_max_score, criteria_is_active in score_rows:
+                scores.setdefault(str(s.team_id), {})[str(s.criteria_id)] = {
+                    'id': s.id,
+                    'score': s.score,
+                    'notes': s.notes or '',
+                    'criteria_name': criteria_name,
+                    'criteria_max_score': criteria_max_score,
+                    'criteria_is_active': criteria_is_active
+                }
+
+            response = jsonify({
+                'criteria': [{
+                    'id': c.id,
+                    'name': c.name,
+                    'description': c.description,
+                    'max_score': c.max_score,
+                    'weight_percentage': c.weight_percentage
+                } for c in criterias],
+                'teams': [{
+                    'id': t.id,
+                    'name': t.name,
+                    'description': t.description,
+                    'created_at': t.created_at.isoformat()
+                } for t in teams],
+                'scores': scores
+            })
+
+            # The sheet is judge-specific: let the browser keep it but make it
+            # revalidate, answering with 304 when nothing has changed
+            response.add_etag()
+            response.headers['Cache-Control'] = 'private, no-cache'
+            response.vary.add('Authorization')
+            return response.make_conditional(request)
+        except Exception as e:
+            print(f"Error in get_judge_sheet: {str(e)}")
+            return jsonify({"msg": f"Error fetching judge sheet: {str(e)}"}), 500
+
     # Results route
     @app.route('/api/results', methods=['GET'])
     @jwt_required()
+    @admission.guard('results', authorize=current_user_is_admin)
     def get_results():
         try:
             current_user_id = get_jwt_identity()
@@ -612,52 +854,136 @@ def create_app(config_name='default'):
             
             if not current_user.is_admin:
                 return jsonify({"msg": "Admin access required"}), 403
-                
-            teams = Team.query.all()
-            criterias = Criteria.query.filter_by(is_active=True).all()
             
-            results = []
-            for team in teams:
-                team_scores = {}
-                weighted_total = 0
-                
-                for criteria in criterias:
-                    scores = Score.query.filter_by(
-                        team_id=team.id,
-                        criteria_id=criteria.id
-                    ).all()
-                    
-                    if scores:
-                        avg_score = sum(s.score for s in scores) / len(scores)
-                        percentage_earned = (avg_score / criteria.max_score) * criteria.weight_percentage
-                        weighted_total += percentage_earned
-                        
-                        team_scores[criteria.name] = {
-                            'average': avg_score,
-                            'max': criteria.max_score,
-                            'weight_percentage': criteria.weight_percentage,
-                            'percentage_earned': percentage_earned,
-                            'count': len(scores)
-                        }
+            # Concurrent requests share one computation
+            return jsonify(admission.run('results', fetch_results))
+        except Overloaded as e:
+            return overloaded_response(e)
+        except Exception as e:
+            print(f"Error in get_results: {str(e)}")
+            return jsonify({"msg": f"Error fetching results: {str(e)}"}), 500
+    
+    leaderboard = LeaderboardPublisher(app, fetch_results)
+    if app.config['LEADERBOARD_POLL_SECONDS'] > 0:
+        leaderboard.start()
+    
+    @app.route('/api/results/history', methods=['GET'])
+    @jwt_required()
+    @admission.guard('results-history', authorize=current_user_is_admin)
+    def get_results_history():
+        """Reconstruct results as they stood at ?at=<ISO timestamp>.
+
+        Replays the score event log from the nearest checkpoint. Ranking uses
+        the teams and active criteria as they exist now. history_starts_at is
+        set when the log was seeded from scores that predate it; results
+        before that time are not available.
+        """
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            try:
+                at = datetime.fromisoformat(request.args['at'])
+            except (KeyError, ValueError):
+                return jsonify({"msg": "Query parameter 'at' must be an ISO 8601 timestamp"}), 400
+            
+            # Event timestamps are stored as naive UTC
+            if at.tzinfo is not None:
+                at = at.astimezone(timezone.utc).replace(tzinfo=None)
+            
+            def compute_history():
+                state, checkpoint, replayed = state_at(at)
+                teams = Team.query.all()
+                criterias = Criteria.query.filter_by(is_active=True).all()
+                # Scores that existed before the log did were recorded as a
+                # baseline when it was seeded; nothing earlier is known
+                seeded_at = baseline_at()
                 
-                results.append({
-                    'team_id': team.id,
-                    'team_name': team.name,
-                    'scores': team_scores,
-                    'total_percentage': weighted_total,
-                    'max_possible': 100.0
-                })
+                return {
+                    'at': at.isoformat(),
+                    'checkpoint_id': checkpoint.id if checkpoint else None,
+                    'events_replayed': replayed,
+                    'history_starts_at': seeded_at.isoformat() if seeded_at else None,
+                    'includes_baseline': seeded_at is not None and at >= seeded_at,
+                    'results': results_from_state(state, teams, criterias)
+                }
+            
+            return jsonify(admission.run(('results-history', at), compute_history))
+        except Overloaded as e:
+            return overloaded_response(e)
+        except Exception as e:
+            print(f"Error in get_results_history: {str(e)}")
+            return jsonify({"msg": f"Error fetching results history: {str(e)}"}), 500
+    
+    @app.route('/api/score-events/checkpoint', methods=['POST'])
+    @jwt_required()
+    def create_score_checkpoint():
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
             
-            results.sort(key=lambda x: x['total_percentage'], reverse=True)
+            checkpoint = create_checkpoint()
+            if not checkpoint:
+                return jsonify({"msg": "No new score events since the last checkpoint"})
             
-            return jsonify(results)
+            return jsonify({
+                'id': checkpoint.id,
+                'last_event_id': checkpoint.last_event_id,
+                'last_event_at': checkpoint.last_event_at.isoformat()
+            }), 201
         except Exception as e:
-            print(f"Error in get_results: {str(e)}")
-            return jsonify({"msg": f"Error fetching results: {str(e)}"}), 500
+            db.session.rollback()
+            print(f"Error in create_score_checkpoint: {str(e)}")
+            return jsonify({"msg": f"Error creating checkpoint: {str(e)}"}), 500
     
     # Team feedback route
+    def compute_team_feedback(team):
+        criterias = Criteria.query.filter_by(is_active=True).all()
+        
+        feedback = {
+            'team_id': team.id,
+            'team_name': team.name,
+            'team_description': team.description,
+            'criteria_feedback': []
+        }
+        
+        for criteria in criterias:
+            scores = Score.query.filter_by(
+                team_id=team.id,
+                criteria_id=criteria.id
+            ).all()
+            
+            judge_feedback = []
+            for score in scores:
+                judge = User.query.get(score.judge_id)
+                judge_feedback.append({
+                    'judge_name': judge.username if judge else 'Unknown',
+                    'score': score.score,
+                    'notes': score.notes,
+                    'created_at': score.created_at.isoformat()
+                })
+            
+            if judge_feedback:
+                avg_score = sum(s.score for s in scores) / len(scores)
+                feedback['criteria_feedback'].append({
+                    'criteria_name': criteria.name,
+                    'criteria_description': criteria.description,
+                    'max_score': criteria.max_score,
+                    'average_score': avg_score,
+                    'judge_feedback': judge_feedback
+                })
+        
+        return feedback
+    
     @app.route('/api/team-feedback/<int:team_id>', methods=['GET'])
     @jwt_required()
+    @admission.guard('team-feedback', authorize=current_user_is_admin)
     def get_team_feedback(team_id):
         try:
             current_user_id = get_jwt_identity()
@@ -667,46 +993,228 @@ def create_app(config_name='default'):
                 return jsonify({"msg": "Admin access required"}), 403
             
             team = Team.query.get_or_404(team_id)
-            criterias = Criteria.query.filter_by(is_active=True).all()
             
-            feedback = {
-                'team_id': team.id,
-                'team_name': team.name,
-                'team_description': team.description,
-                'criteria_feedback': []
-            }
-            
-            for criteria in criterias:
-                scores = Score.query.filter_by(
-                    team_id=team.id,
-                    criteria_id=criteria.id
-                ).all()
-                
-                judge_feedback = []
-                for score in scores:
-                    judge = User.query.get(score.judge_id)
-                    judge_feedback.append({
-                        'judge_name': judge.username if judge else 'Unknown',
-                        'score': score.score,
-                        'notes': score.notes,
-                        'created_at': score.created_at.isoformat()
-                    })
-                
-                if judge_feedback:
-                    avg_score = sum(s.score for s in scores) / len(scores)
-                    feedback['criteria_feedback'].append({
-                        'criteria_name': criteria.name,
-                        'criteria_description': criteria.description,
-                        'max_score': criteria.max_score,
-                        'average_score': avg_score,
-                        'judge_feedback': judge_feedback
-                    })
-            
-            return jsonify(feedback)
+            return jsonify(admission.run(
+                ('team-feedback', team.id), lambda: compute_team_feedback(team)
+            ))
+        except Overloaded as e:
+            return overloaded_response(e)
         except Exception as e:
             print(f"Error in get_team_feedback: {str(e)}")
             return jsonify({"msg": f"Error fetching team feedback: {str(e)}"}), 500
     
+    # Feedback report routes
+    def reports_dir():
+        return app.config.get('REPORTS_DIR') or os.path.join(app.instance_path, 'reports')
+    
+    @app.route('/api/reports', methods=['POST'])
+    @jwt_required()
+    def create_report_job():
+        """Start rendering every team's feedback report in the background"""
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            job = ReportJob(app)
+            # Copy before starting: the job thread updates its status as it runs
+            status = dict(job.status)
+            job.start()
+            
+            return jsonify({
+                **status,
+                'status_url': url_for('get_report_job', job_id=job.job_id),
+                'download_url': url_for('download_report_job', job_id=job.job_id)
+            }), 202
+        except Exception as e:
+            print(f"Error in create_report_job: {str(e)}")
+            return jsonify({"msg": f"Error starting report job: {str(e)}"}), 500
+    
+    @app.route('/api/reports/<job_id>', methods=['GET'])
+    @jwt_required()
+    def get_report_job(job_id):
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            status = load_status(reports_dir(), job_id)
+            if status is None:
+                return jsonify({"msg": "Report job not found"}), 404
+            
+            return jsonify(status)
+        except Exception as e:
+            print(f"Error in get_report_job: {str(e)}")
+            return jsonify({"msg": f"Error fetching report job: {str(e)}"}), 500
+    
+    @app.route('/api/reports/<job_id>/download', methods=['GET'])
+    @jwt_required()
+    def download_report_job(job_id):
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            status = load_status(reports_dir(), job_id)
+            if status is None:
+                return jsonify({"msg": "Report job not found"}), 404
+            if status['status'] != 'complete':
+                return jsonify({"msg": "Report job is not complete", **status}), 409
+            
+            return send_file(
+                os.path.join(reports_dir(), f'{job_id}.zip'),
+                mimetype='application/zip',
+                as_attachment=True,
+                download_name='team-feedback-reports.zip'
+            )
+        except Exception as e:
+            print(f"Error in download_report_job: {str(e)}")
+            return jsonify({"msg": f"Error downloading reports: {str(e)}"}), 500
+    
+    # Public leaderboard routes (served from snapshot files, never the database)
+    def send_snapshot(name, max_age):
+        path = os.path.join(leaderboard.directory, name)
+        if not os.path.exists(path):
+            return jsonify({"msg": "Leaderboard has not been published yet"}), 404
+        return send_file(path, max_age=max_age)
+    
+    @app.route('/api/public/leaderboard', methods=['GET'])
+    def get_public_leaderboard():
+        return send_snapshot('latest.json', app.config['LEADERBOARD_POLL_SECONDS'])
+    
+    @app.route('/api/public/leaderboard.html', methods=['GET'])
+    def get_public_leaderboard_html():
+        return send_snapshot('latest.html', app.config['LEADERBOARD_POLL_SECONDS'])
+    
+    @app.route('/api/public/leaderboard/<name>', methods=['GET'])
+    def get_public_leaderboard_version(name):
+        """A specific snapshot version; its content never changes"""
+        if not SNAPSHOT_NAME.fullmatch(name):
+            return jsonify({"msg": "Snapshot not found"}), 404
+        response = send_snapshot(name, 365 * 24 * 3600)
+        if isinstance(response, tuple):
+            return jsonify({"msg": "Snapshot not found"}), 404
+        response.headers['Cache-Control'] += ', immutable'
+        return response
+    
+    @app.route('/api/leaderboard/publish', methods=['POST'])
+    @jwt_required()
+    def publish_leaderboard():
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            snapshot = leaderboard.publish()
+            if snapshot is None:
+                return jsonify({"msg": "Leaderboard unchanged since the last snapshot"})
+            
+            return jsonify({
+                'version': snapshot['version'],
+                'generated_at': snapshot['generated_at']
+            }), 201
+        except Exception as e:
+            print(f"Error in publish_leaderboard: {str(e)}")
+            return jsonify({"msg": f"Error publishing leaderboard: {str(e)}"}), 500
+    
+    # Backup routes
+    def backups_dir():
+        return app.config.get('BACKUP_DIR') or os.path.join(app.instance_path, 'backups')
+    
+    @app.route('/api/backups', methods=['GET'])
+    @jwt_required()
+    def get_backups():
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            return jsonify(list_backups(backups_dir()))
+        except Exception as e:
+            print(f"Error in get_backups: {str(e)}")
+            return jsonify({"msg": f"Error fetching backups: {str(e)}"}), 500
+    
+    @app.route('/api/backups', methods=['POST'])
+    @jwt_required()
+    def create_database_backup():
+        """Take an online backup without blocking score submissions"""
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            lock = backup_lock(backups_dir())
+            if not lock.acquire():
+                return jsonify({"msg": "A backup or restore is already running"}), 409
+            try:
+                info = create_backup(
+                    db.engine, db.metadata, backups_dir(),
+                    pages=app.config['BACKUP_PAGES_PER_STEP'],
+                    sleep=app.config['BACKUP_STEP_SLEEP'],
+                    label='manual'
+                )
+            finally:
+                lock.release()
+            
+            return jsonify(info), 201
+        except Exception as e:
+            print(f"Error in create_database_backup: {str(e)}")
+            return jsonify({"msg": f"Error creating backup: {str(e)}"}), 500
+    
+    @app.route('/api/backups/<name>/restore', methods=['POST'])
+    @jwt_required()
+    def restore_database_backup(name):
+        """Restore a backup, saving the current state as a pre-restore backup first"""
+        try:
+            current_user_id = get_jwt_identity()
+            current_user = User.query.get(current_user_id)
+            
+            if not current_user.is_admin:
+                return jsonify({"msg": "Admin access required"}), 403
+            
+            path = os.path.join(backups_dir(), name)
+            if not BACKUP_NAME.fullmatch(name) or not os.path.exists(path):
+                return jsonify({"msg": "Backup not found"}), 404
+            
+            lock = backup_lock(backups_dir())
+            if not lock.acquire():
+                return jsonify({"msg": "A backup or restore is already running"}), 409
+            try:
+                safety = create_backup(
+                    db.engine, db.metadata, backups_dir(),
+                    pages=app.config['BACKUP_PAGES_PER_STEP'],
+                    sleep=app.config['BACKUP_STEP_SLEEP'],
+                    label='pre-restore'
+                )
+                pre_restore_cursor = read_change_cursor(db.session)
+                db.session.remove()
+                restore_backup(db.engine, db.metadata, path)
+                cursor = reset_change_cursor(db.session, pre_restore_cursor)
+            finally:
+                lock.release()
+            
+            return jsonify({
+                "msg": "Backup restored successfully",
+                "restored": name,
+                "pre_restore_backup": safety['name'],
+                "cursor": cursor
+            })
+        except Exception as e:
+            print(f"Error in restore_database_backup: {str(e)}")
+            return jsonify({"msg": f"Error restoring backup: {str(e)}"}), 500
+    
     return app
 
 if __name__ == '__main__':
@@ -0,0 +1,308 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zipfile
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Older backups were named to the second; new ones add microseconds
+BACKUP_NAME = re.compile(r'hackfest-\d{8}T\d{6}(\d{6})?Z(-[a-z-]+)?\.(sqlite3|pgcopy\.zip)')
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+class FileLock:
+    """Non-blocking lock shared by every process that uses the same path.
+
+    Held with flock on the file, plus a thread lock so threads in one
+    process exclude each other too. Without fcntl it only covers the
+    current process.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        with _thread_locks_guard:
+            self._thread_lock = _thread_locks.setdefault(path, threading.Lock())
+
+    def acquire(self):
+        if not self._thread_lock.acquire(blocking=False):
+            return False
+        if fcntl is None:
+            return True
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            handle = open(self.path, 'a')
+        except OSError:
+            self._thread_lock.release()
+            raise
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            self._thread_lock.release()
+            return False
+        self._file = handle
+        return True
+
+    def release(self):
+        if self._file is not None:
+            # Closing the file drops the flock
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+def backup_lock(directory):
+    """Lock that lets only one backup or restore run at a time across all workers"""
+    return FileLock(os.path.join(directory, '.backup.lock'))
+
+
+def backup_name(dialect, label=None):
+    stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%fZ')
+    suffix = f'-{label}' if label else ''
+    extension = 'sqlite3' if dialect == 'sqlite' else 'pgcopy.zip'
+    return f'hackfest-{stamp}{suffix}.{extension}'
+
+
+class BackupRestarted(Exception):
+    """Writers keep changing the source faster than a stepped copy can finish"""
+
+
+def sqlite_backup(source_path, dest_path, pages=64, sleep=0.05, max_restarts=5):
+    """Copy a live SQLite database with the online backup API.
+
+    Copies `pages` pages per step and sleeps between steps so writers can
+    take the lock in between instead of waiting for the whole copy.
+    SQLite restarts the copy whenever another connection writes. A step
+    makes progress when it gets closer to the end than any step before it;
+    after max_restarts steps in a row without progress the rest is copied
+    in one step, which holds the read lock only for as long as the copy
+    takes. Steps that are only catching up after a restart do not count as
+    progress, so writes spaced wider than a step cannot restart it forever.
+
+    Returns the number of restarts and whether the single-step fallback
+    was used.
+    """
+    partial_path = dest_path + '.part'
+    source = sqlite3.connect(source_path)
+    dest = sqlite3.connect(partial_path)
+    progress = {'remaining': None, 'lowest': None, 'stalled': 0, 'restarts': 0, 'single_step': False}
+
+    def pause(status, remaining, total):
+        if progress['remaining'] is not None and remaining >= progress['remaining']:
+            progress['restarts'] += 1
+        if progress['lowest'] is None or remaining < progress['lowest']:
+            progress['lowest'] = remaining
+            progress['stalled'] = 0
+        else:
+            progress['stalled'] += 1
+            if progress['stalled'] > max_restarts:
+                raise BackupRestarted()
+        progress['remaining'] = remaining
+        if remaining:
+            time.sleep(sleep)
+
+    try:
+        try:
+            source.backup(dest, pages=pages, progress=pause, sleep=sleep)
+        except BackupRestarted:
+            progress['single_step'] = True
+            source.backup(dest)
+    finally:
+        dest.close()
+        source.close()
+    os.replace(partial_path, dest_path)
+    return {'restarts': progress['restarts'], 'single_step': progress['single_step']}
+
+
+def postgres_export(engine, metadata, dest_path):
+    """Stream every table out with COPY into a zip, from one consistent snapshot"""
+    partial_path = dest_path + '.part'
+    preparer = engine.dialect.identifier_preparer
+    manifest = {'tables': []}
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY')
+        with zipfile.ZipFile(partial_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for table in metadata.sorted_tables:
+                columns = [c.name for c in table.columns]
+                column_list = ', '.join(preparer.quote(c) for c in columns)
+                with archive.open(f'{table.name}.copy', 'w') as fh:
+                    cursor.copy_expert(
+                        f'COPY {preparer.quote(table.name)} ({column_list}) TO STDOUT', fh
+                    )
+                manifest['tables'].append({'name': table.name, 'columns': columns})
+            archive.writestr('manifest.json', json.dumps(manifest))
+        conn.rollback()
+    finally:
+        conn.close()
+    os.replace(partial_path, dest_path)
+
+
+def create_backup(engine, metadata, directory, pages=64, sleep=0.05, label=None):
+    """Write a backup of the database into directory and describe it"""
+    os.makedirs(directory, exist_ok=True)
+    dialect = engine.dialect.name
+    name = backup_name(dialect, label)
+    path = os.path.join(directory, name)
+
+    started = time.perf_counter()
+    if dialect == 'sqlite':
+        sqlite_backup(engine.url.database, path, pages=pages, sleep=sleep)
+    elif dialect == 'postgresql':
+        postgres_export(engine, metadata, path)
+    else:
+        raise ValueError(f"Backups are not supported for {dialect}")
+
+    return {
+        'name': name,
+        'size': os.path.getsize(path),
+        'duration_seconds': time.perf_counter() - started
+    }
+
+
+def restore_backup(engine, metadata, path):
+    """Replace the live database contents with a backup"""
+    dialect = engine.dialect.name
+    if dialect == 'sqlite':
+        source = sqlite3.connect(path)
+        dest = sqlite3.connect(engine.url.database)
+        try:
+            # One step, so readers never see a half restored database
+            source.backup(dest)
+        finally:
+            dest.close()
+            source.close()
+    elif dialect == 'postgresql':
+        postgres_import(engine, metadata, path)
+    else:
+        raise ValueError(f"Backups are not supported for {dialect}")
+
+    # Pooled connections may hold pages from before the restore
+    engine.dispose()
+
+
+def postgres_import(engine, metadata, path):
+    preparer = engine.dialect.identifier_preparer
+    known_tables = {t.name: t for t in metadata.sorted_tables}
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        with zipfile.ZipFile(path) as archive:
+            manifest = json.loads(archive.read('manifest.json'))
+            names = [t['name'] for t in manifest['tables'] if t['name'] in known_tables]
+            cursor.execute(
+                f"TRUNCATE {', '.join(preparer.quote(n) for n in names)} RESTART IDENTITY CASCADE"
+            )
+            for entry in manifest['tables']:
+                if entry['name'] not in known_tables:
+                    continue
+                column_list = ', '.join(preparer.quote(c) for c in entry['columns'])
+                with archive.open(f"{entry['name']}.copy") as fh:
+                    cursor.copy_expert(
+                        f"COPY {preparer.quote(entry['name'])} ({column_list}) FROM STDIN", fh
+                    )
+
+        # Move id sequences past the restored rows
+        for name in names:
+            if 'id' in known_tables[name].columns:
+                cursor.execute(
+                    f"SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {preparer.quote(name)}), 0) + 1, false)",
+                    (name,)
+                )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def list_backups(directory):
+    if not os.path.isdir(directory):
+        return []
+    backups = []
+    for name in sorted(os.listdir(directory), reverse=True):
+        if BACKUP_NAME.fullmatch(name):
+            stat = os.stat(os.path.join(directory, name))
+            backups.append({
+                'name': name,
+                'size': stat.st_size,
+                'created_at': datetime.utcfromtimestamp(stat.st_mtime).isoformat()
+            })
+    return backups
+
+
+def prune_backups(directory, keep):
+    """Delete all but the newest `keep` scheduled backups"""
+    scheduled = [b['name'] for b in list_backups(directory) if '-scheduled.' in b['name']]
+    for name in scheduled[keep:]:
+        os.remove(os.path.join(directory, name))
+
+
+class BackupScheduler:
+    """Takes a backup every interval_minutes on a background thread.
+
+    Every worker starts one, but only the process holding the scheduler
+    lock in the backup directory takes backups. The others try to take
+    over on each tick, so scheduling continues if that process exits.
+    """
+
+    def __init__(self, app, db, interval_minutes):
+        self.app = app
+        self.db = db
+        self.interval = interval_minutes * 60
+        self.directory = app.config.get('BACKUP_DIR') or os.path.join(app.instance_path, 'backups')
+        self._scheduler_lock = FileLock(os.path.join(self.directory, '.scheduler.lock'))
+        self._is_scheduler = False
+        self._stop = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name='backup-scheduler', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+        if self._is_scheduler:
+            self._scheduler_lock.release()
+            self._is_scheduler = False
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            if not self._is_scheduler:
+                self._is_scheduler = self._scheduler_lock.acquire()
+                if not self._is_scheduler:
+                    continue
+
+            lock = backup_lock(self.directory)
+            if not lock.acquire():
+                continue
+            try:
+                with self.app.app_context():
+                    config = self.app.config
+                    info = create_backup(
+                        self.db.engine, self.db.metadata, self.directory,
+                        pages=config['BACKUP_PAGES_PER_STEP'],
+                        sleep=config['BACKUP_STEP_SLEEP'],
+                        label='scheduled'
+                    )
+                    prune_backups(self.directory, config['BACKUP_KEEP'])
+                    print(f"✓ Scheduled backup written: {info['name']} in {info['duration_seconds']:.2f}s")
+            except Exception as e:
+                print(f"Error in scheduled backup: {str(e)}")
+            finally:
+                lock.release()
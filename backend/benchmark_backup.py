@@ -0,0 +1,118 @@
+"""Benchmark online SQLite backups against concurrent score writes.
+
+Fills a scratch database with scores, keeps a writer thread upserting
+scores the way judges do, and reports backup duration next to write
+latency for a few page-step settings (and with no backup running).
+Backups that kept being restarted by the writer and finished with the
+single-step copy are flagged, since their latency is not the paced one's.
+
+    python benchmark_backup.py [--scores 20000] [--seconds 3] [--write-gap 0.002]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from backups import sqlite_backup
+
+SETTINGS = [
+    # (pages per step, sleep between steps)
+    (-1, 0),
+    (256, 0.01),
+    (64, 0.05),
+    (16, 0.05),
+]
+
+
+def build_database(path, score_count):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE scores (
+            id INTEGER PRIMARY KEY,
+            judge_id INTEGER NOT NULL,
+            team_id INTEGER NOT NULL,
+            criteria_id INTEGER NOT NULL,
+            score FLOAT NOT NULL,
+            notes TEXT,
+            UNIQUE (judge_id, team_id, criteria_id)
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO scores (judge_id, team_id, criteria_id, score, notes) VALUES (?, ?, ?, ?, ?)",
+        ((i // 1000, (i // 10) % 100, i % 10, random.uniform(0, 10), 'x' * 200)
+         for i in range(score_count))
+    )
+    conn.commit()
+    conn.close()
+
+
+def write_scores(path, stop, latencies, score_count, gap):
+    conn = sqlite3.connect(path, timeout=30)
+    while not stop.is_set():
+        i = random.randrange(score_count)
+        started = time.perf_counter()
+        conn.execute(
+            "UPDATE scores SET score = ?, notes = ? WHERE judge_id = ? AND team_id = ? AND criteria_id = ?",
+            (random.uniform(0, 10), 'updated', i // 1000, (i // 10) % 100, i % 10)
+        )
+        conn.commit()
+        latencies.append((time.perf_counter() - started) * 1000)
+        time.sleep(gap)
+    conn.close()
+
+
+def run(path, scratch, setting, seconds, score_count, gap):
+    stop = threading.Event()
+    latencies = []
+    writer = threading.Thread(target=write_scores, args=(path, stop, latencies, score_count, gap))
+    writer.start()
+
+    duration = None
+    outcome = None
+    if setting is None:
+        time.sleep(seconds)
+    else:
+        pages, sleep = setting
+        started = time.perf_counter()
+        outcome = sqlite_backup(path, os.path.join(scratch, 'backup.sqlite3'), pages=pages, sleep=sleep)
+        duration = time.perf_counter() - started
+
+    stop.set()
+    writer.join()
+    latencies.sort()
+    return duration, outcome, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scores', type=int, default=20000)
+    parser.add_argument('--seconds', type=float, default=3)
+    parser.add_argument('--write-gap', type=float, default=0.002,
+                        help='seconds the writer waits between score writes')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, 'hackfest.db')
+        build_database(path, args.scores)
+        print(f"Database: {args.scores} scores, {os.path.getsize(path) / 1024:.0f} KiB")
+        print(f"{'pages/step':>10} {'sleep':>6} {'backup s':>9} {'restarts':>8} {'fallback':>8} "
+              f"{'writes':>7} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7}")
+
+        for setting in [None] + SETTINGS:
+            duration, outcome, latencies = run(path, scratch, setting, args.seconds, args.scores, args.write_gap)
+            pages, sleep = setting if setting else ('none', '-')
+            restarts = outcome['restarts'] if outcome else '-'
+            fallback = ('yes' if outcome['single_step'] else 'no') if outcome else '-'
+            p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0
+            print(f"{pages:>10} {sleep:>6} {duration if duration is not None else 0:>9.2f} "
+                  f"{restarts:>8} {fallback:>8} "
+                  f"{len(latencies):>7} {statistics.median(latencies) if latencies else 0:>7.2f} "
+                  f"{p99:>7.2f} {max(latencies, default=0):>7.2f}")
+
+
+if __name__ == '__main__':
+    main()
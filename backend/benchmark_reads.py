@@ -0,0 +1,183 @@
+"""Benchmark the row-based read path against full ORM hydration.
+
+Seeds a scratch SQLite database (10k scores by default) and, for each read
+endpoint's query, reports median time and peak Python memory for the old
+ORM version and the read_models version.
+
+    python benchmark_reads.py [--teams 50] [--criteria 10] [--judges 20] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+def orm_my_scores(judge_id):
+    from models import Score
+    return [{
+        'id': s.id,
+        'team_id': s.team_id,
+        'criteria_id': s.criteria_id,
+        'score': s.score,
+        'notes': s.notes
+    } for s in Score.query.filter_by(judge_id=judge_id).all()]
+
+
+def row_my_scores(judge_id):
+    from read_models import fetch_judge_scores
+    return [{
+        'id': s.id,
+        'team_id': s.team_id,
+        'criteria_id': s.criteria_id,
+        'score': s.score,
+        'notes': s.notes
+    } for s in fetch_judge_scores(judge_id)]
+
+
+def orm_teams():
+    from models import Team
+    return [{'id': t.id, 'name': t.name, 'description': t.description,
+             'created_at': t.created_at.isoformat()} for t in Team.query.all()]
+
+
+def row_teams():
+    from read_models import fetch_teams
+    return [{'id': t.id, 'name': t.name, 'description': t.description,
+             'created_at': t.created_at.isoformat()} for t in fetch_teams()]
+
+
+def orm_users():
+    from models import User
+    return [{
+        'id': u.id,
+        'username': u.username,
+        'is_admin': u.is_admin,
+        'created_at': u.created_at.isoformat() if u.created_at else None,
+        'assigned_criteria': [c.id for c in u.assigned_criteria] if not u.is_admin else []
+    } for u in User.query.all()]
+
+
+def row_users():
+    from read_models import fetch_users
+    users, assigned = fetch_users()
+    return [{
+        'id': u.id,
+        'username': u.username,
+        'is_admin': u.is_admin,
+        'created_at': u.created_at.isoformat() if u.created_at else None,
+        'assigned_criteria': assigned.get(u.id, []) if not u.is_admin else []
+    } for u in users]
+
+
+def orm_results():
+    """The get_results implementation this replaced: one query per team and criterion"""
+    from models import Team, Criteria, Score
+    teams = Team.query.all()
+    criterias = Criteria.query.filter_by(is_active=True).all()
+
+    results = []
+    for team in teams:
+        team_scores = {}
+        weighted_total = 0
+        for criteria in criterias:
+            scores = Score.query.filter_by(team_id=team.id, criteria_id=criteria.id).all()
+            if scores:
+                avg_score = sum(s.score for s in scores) / len(scores)
+                percentage_earned = (avg_score / criteria.max_score) * criteria.weight_percentage
+                weighted_total += percentage_earned
+                team_scores[criteria.name] = {
+                    'average': avg_score,
+                    'max': criteria.max_score,
+                    'weight_percentage': criteria.weight_percentage,
+                    'percentage_earned': percentage_earned,
+                    'count': len(scores)
+                }
+        results.append({
+            'team_id': team.id,
+            'team_name': team.name,
+            'scores': team_scores,
+            'total_percentage': weighted_total,
+            'max_possible': 100.0
+        })
+    results.sort(key=lambda x: x['total_percentage'], reverse=True)
+    return results
+
+
+def row_results():
+    from read_models import fetch_results
+    return fetch_results()
+
+
+def seed(db, teams, criterias, judges):
+    from models import User, Team, Criteria, Score
+    db.session.add_all([Team(name=f'Team {i}', description='x' * 100) for i in range(teams)])
+    criteria_rows = [Criteria(name=f'Criteria {i}', weight_percentage=100 / criterias)
+                     for i in range(criterias)]
+    db.session.add_all(criteria_rows)
+    for i in range(judges):
+        judge = User(username=f'judge{i}', password_hash='x')
+        judge.assigned_criteria = criteria_rows[:3]
+        db.session.add(judge)
+    db.session.commit()
+
+    db.session.execute(Score.__table__.insert(), [
+        {'judge_id': j + 2, 'team_id': t + 1, 'criteria_id': c + 1,
+         'score': (j + t + c) % 10, 'notes': 'Solid work on the demo', 'change_seq': 0}
+        for j in range(judges) for t in range(teams) for c in range(criterias)
+    ])
+    db.session.commit()
+
+
+def measure(db, fn, runs):
+    times = []
+    peaks = []
+    for _ in range(runs):
+        db.session.remove()
+        tracemalloc.start()
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+    return statistics.median(times), statistics.median(peaks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--teams', type=int, default=50)
+    parser.add_argument('--criteria', type=int, default=10)
+    parser.add_argument('--judges', type=int, default=20)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp()
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(scratch, 'bench.db')
+    os.environ.setdefault('LEADERBOARD_POLL_SECONDS', '0')
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from app import create_app
+    from models import db
+
+    app = create_app('production')
+    with app.app_context():
+        seed(db, args.teams, args.criteria, args.judges)
+        print(f"Dataset: {args.judges * args.teams * args.criteria} scores, "
+              f"{args.teams} teams, {args.criteria} criteria, {args.judges} judges")
+        print(f"{'endpoint':<14} {'ORM ms':>8} {'rows ms':>8} {'ORM KiB':>9} {'rows KiB':>9}")
+
+        cases = [
+            ('my_scores', lambda: orm_my_scores(2), lambda: row_my_scores(2)),
+            ('teams', orm_teams, row_teams),
+            ('users', orm_users, row_users),
+            ('results', orm_results, row_results),
+        ]
+        for name, orm_fn, row_fn in cases:
+            orm_ms, orm_kib = measure(db, orm_fn, args.runs)
+            row_ms, row_kib = measure(db, row_fn, args.runs)
+            print(f"{name:<14} {orm_ms:>8.2f} {row_ms:>8.2f} {orm_kib:>9.0f} {row_kib:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,10 +10,56 @@ class Config:
         database_url = database_url.replace('postgres://', 'postgresql://', 1)
     
     SQLALCHEMY_DATABASE_URI = database_url
+    
+    # Optional read replicas, comma separated; GET requests are spread across them
+    read_urls = os.environ.get('DATABASE_READ_URLS') or os.environ.get('DATABASE_READ_URL') or ''
+    SQLALCHEMY_BINDS = {
+        f'replica_{i}': url.strip().replace('postgres://', 'postgresql://', 1)
+        for i, url in enumerate(u for u in read_urls.split(',') if u.strip())
+    }
+    READ_REPLICA_STICKY_SECONDS = int(os.environ.get('READ_REPLICA_STICKY_SECONDS', 10))
+    READ_REPLICA_RETRY_SECONDS = int(os.environ.get('READ_REPLICA_RETRY_SECONDS', 30))
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    
+    # Fold the score event log into a checkpoint every N events
+    SCORE_CHECKPOINT_INTERVAL = int(os.environ.get('SCORE_CHECKPOINT_INTERVAL', 200))
+    
+    # Team feedback report jobs; files go to <instance>/reports unless set.
+    # Only the newest REPORT_KEEP finished jobs are kept
+    REPORTS_DIR = os.environ.get('REPORTS_DIR')
+    REPORT_WORKERS = int(os.environ.get('REPORT_WORKERS', min(4, os.cpu_count() or 1)))
+    REPORT_KEEP = int(os.environ.get('REPORT_KEEP', 10))
+    
+    # Online backups; files go to <instance>/backups unless set. An interval
+    # of 0 turns scheduled backups off
+    BACKUP_DIR = os.environ.get('BACKUP_DIR')
+    BACKUP_INTERVAL_MINUTES = int(os.environ.get('BACKUP_INTERVAL_MINUTES', 0))
+    BACKUP_KEEP = int(os.environ.get('BACKUP_KEEP', 12))
+    BACKUP_PAGES_PER_STEP = int(os.environ.get('BACKUP_PAGES_PER_STEP', 64))
+    BACKUP_STEP_SLEEP = float(os.environ.get('BACKUP_STEP_SLEEP', 0.05))
+    
+    # Load shedding for results and feedback reads; score writes are never limited.
+    # Keep ADMISSION_MAX_INFLIGHT below the server thread count
+    ADMISSION_RATE = float(os.environ.get('ADMISSION_RATE', 2))
+    ADMISSION_BURST = int(os.environ.get('ADMISSION_BURST', 10))
+    ADMISSION_MAX_INFLIGHT = int(os.environ.get('ADMISSION_MAX_INFLIGHT', 2))
+    ADMISSION_MAX_COMPUTE = int(os.environ.get('ADMISSION_MAX_COMPUTE', 1))
+    ADMISSION_RETRY_AFTER = int(os.environ.get('ADMISSION_RETRY_AFTER', 2))
+    # Path to a local SQLite file to share rate limits between worker processes
+    ADMISSION_STORE = os.environ.get('ADMISSION_STORE')
+    
+    # Public leaderboard snapshots; files go to <instance>/leaderboard unless set.
+    # A poll interval of 0 turns automatic publishing off; a page refresh of
+    # 0 leaves the auto-reload out of the published HTML
+    LEADERBOARD_DIR = os.environ.get('LEADERBOARD_DIR')
+    LEADERBOARD_HIDE_SCORES = os.environ.get('LEADERBOARD_HIDE_SCORES', 'true').lower() in ('1', 'true', 'yes')
+    LEADERBOARD_POLL_SECONDS = int(os.environ.get('LEADERBOARD_POLL_SECONDS', 5))
+    LEADERBOARD_INTERVAL_SECONDS = int(os.environ.get('LEADERBOARD_INTERVAL_SECONDS', 300))
+    LEADERBOARD_KEEP = int(os.environ.get('LEADERBOARD_KEEP', 20))
+    LEADERBOARD_REFRESH_SECONDS = int(os.environ.get('LEADERBOARD_REFRESH_SECONDS', 10))
 
 class DevelopmentConfig(Config):
     DEBUG = True
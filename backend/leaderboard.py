@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from html import escape
+
+from models import db, read_change_cursor
+
+SNAPSHOT_NAME = re.compile(r'leaderboard-[0-9a-f]{12}\.(json|html)')
+
+
+def build_snapshot(results, hide_scores):
+    """Public view of the ranking; with hide_scores only names and ranks are kept"""
+    teams = []
+    for rank, result in enumerate(results, start=1):
+        entry = {'rank': rank, 'team_name': result['team_name']}
+        if not hide_scores:
+            entry['total_percentage'] = round(result['total_percentage'], 2)
+        teams.append(entry)
+
+    # Version by content so republishing an unchanged ranking is a no-op
+    version = hashlib.sha256(json.dumps(teams, sort_keys=True).encode()).hexdigest()[:12]
+    return {
+        'version': version,
+        'generated_at': datetime.utcnow().isoformat(),
+        'teams': teams
+    }
+
+
+def render_snapshot_html(snapshot, refresh_seconds):
+    show_scores = any('total_percentage' in t for t in snapshot['teams'])
+    rows = ''.join(
+        f"<tr><td>{t['rank']}</td><td>{escape(t['team_name'])}</td>"
+        + (f"<td>{t['total_percentage']:.2f}%</td>" if show_scores else '')
+        + "</tr>"
+        for t in snapshot['teams']
+    )
+    score_header = '<th>Score</th>' if show_scores else ''
+    refresh = (f'<meta http-equiv="refresh" content="{refresh_seconds}">\n'
+               if refresh_seconds > 0 else '')
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+{refresh}<title>Hackfest Leaderboard</title>
+<style>
+body {{ font-family: sans-serif; max-width: 900px; margin: 2em auto; font-size: 1.4em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 10px; text-align: left; }}
+.muted {{ color: #666; font-size: 0.6em; }}
+</style>
+</head>
+<body>
+<h1>Hackfest Leaderboard</h1>
+<table>
+<tr><th>Rank</th><th>Team</th>{score_header}</tr>
+{rows}
+</table>
+<p class="muted">Updated {escape(snapshot['generated_at'])} UTC</p>
+</body>
+</html>
+"""
+
+
+def _write_atomic(path, content):
+    with open(path + '.tmp', 'w') as f:
+        f.write(content)
+    os.replace(path + '.tmp', path)
+
+
+def latest_version(directory):
+    try:
+        with open(os.path.join(directory, 'latest.json')) as f:
+            return json.load(f).get('version')
+    except (OSError, ValueError):
+        return None
+
+
+def publish_snapshot(results, directory, hide_scores=True, refresh_seconds=30, keep=20):
+    """Write versioned JSON/HTML snapshot files and point latest.* at them.
+
+    Returns the snapshot, or None when latest.* already shows this ranking.
+    """
+    os.makedirs(directory, exist_ok=True)
+    snapshot = build_snapshot(results, hide_scores)
+    if snapshot['version'] == latest_version(directory):
+        return None
+
+    body = json.dumps(snapshot)
+    html = render_snapshot_html(snapshot, refresh_seconds)
+    json_path = os.path.join(directory, f"leaderboard-{snapshot['version']}.json")
+    html_path = os.path.join(directory, f"leaderboard-{snapshot['version']}.html")
+    if os.path.exists(json_path) and os.path.exists(html_path):
+        # A ranking seen before: its immutable files may already be cached,
+        # so keep them as they are and only mark them recent for pruning
+        os.utime(json_path)
+        os.utime(html_path)
+    else:
+        _write_atomic(json_path, body)
+        _write_atomic(html_path, html)
+    _write_atomic(os.path.join(directory, 'latest.json'), body)
+    _write_atomic(os.path.join(directory, 'latest.html'), html)
+    prune_snapshots(directory, keep)
+    return snapshot
+
+
+def prune_snapshots(directory, keep):
+    snapshots = sorted(
+        (os.path.join(directory, name) for name in os.listdir(directory)
+         if SNAPSHOT_NAME.fullmatch(name) and name.endswith('.json')),
+        key=os.path.getmtime, reverse=True
+    )
+    for path in snapshots[keep:]:
+        os.remove(path)
+        html_path = path[:-len('.json')] + '.html'
+        if os.path.exists(html_path):
+            os.remove(html_path)
+
+
+class LeaderboardPublisher:
+    """Republishes the leaderboard snapshot on a background thread.
+
+    Every poll_seconds it reads the change counter and publishes when
+    anything changed since the last snapshot. It also publishes every
+    interval_seconds regardless, which is a no-op when the ranking is the same.
+    """
+
+    def __init__(self, app, compute_results):
+        self.app = app
+        self.compute_results = compute_results
+        self.poll_seconds = app.config['LEADERBOARD_POLL_SECONDS']
+        self.interval_seconds = app.config['LEADERBOARD_INTERVAL_SECONDS']
+        self._last_cursor = None
+        self._since_publish = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        return self.app.config.get('LEADERBOARD_DIR') or os.path.join(self.app.instance_path, 'leaderboard')
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name='leaderboard-publisher', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+    def publish(self):
+        """Publish now; must run inside an app context"""
+        with self._lock:
+            cursor = read_change_cursor(db.session)
+            snapshot = publish_snapshot(
+                self.compute_results(),
+                self.directory,
+                hide_scores=self.app.config['LEADERBOARD_HIDE_SCORES'],
+                refresh_seconds=self.app.config['LEADERBOARD_REFRESH_SECONDS'],
+                keep=self.app.config['LEADERBOARD_KEEP']
+            )
+            self._last_cursor = cursor
+            self._since_publish = 0
+            return snapshot
+
+    def run(self):
+        while not self._stop.wait(self.poll_seconds):
+            self._since_publish += self.poll_seconds
+            try:
+                with self.app.app_context():
+                    cursor = read_change_cursor(db.session)
+                    if cursor != self._last_cursor or self._since_publish >= self.interval_seconds:
+                        snapshot = self.publish()
+                        if snapshot:
+                            print(f"✓ Leaderboard snapshot published: {snapshot['version']}")
+                    db.session.remove()
+            except Exception as e:
+                print(f"Error publishing leaderboard: {str(e)}")
@@ -1,9 +1,13 @@
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from read_replicas import RoutingSession
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_jwt_extended import create_access_token, create_refresh_token
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 # Association table for many-to-many relationship between users and criteria
 user_criteria = db.Table('user_criteria',
@@ -11,7 +15,71 @@ user_criteria = db.Table('user_criteria',
     db.Column('criteria_id', db.Integer, db.ForeignKey('criterias.id'), primary_key=True)
 )
 
-class User(db.Model):
+# Single-row counter handing out the change sequence used as the sync cursor
+change_counter = db.Table('change_counter',
+    db.Column('id', db.Integer, primary_key=True),
+    db.Column('value', db.Integer, nullable=False, default=0)
+)
+
+class ChangeTracked:
+    """Columns stamped on every insert or update for the delta sync feed"""
+    change_seq = db.Column(db.Integer, default=0, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+# Row ids in change_counter: the live sync cursor, and the cursor value at
+# the last restore (clients synced before it must download everything again)
+CHANGE_CURSOR = 1
+RESET_CURSOR = 2
+
+def read_change_cursor(session, row=CHANGE_CURSOR):
+    return session.execute(
+        db.select(change_counter.c.value).where(change_counter.c.id == row)
+    ).scalar()
+
+def next_change_seq(session):
+    # The UPDATE locks the counter row until commit, so sequence numbers
+    # become visible in the order they were handed out
+    session.execute(
+        change_counter.update()
+        .where(change_counter.c.id == CHANGE_CURSOR)
+        .values(value=change_counter.c.value + 1)
+    )
+    return read_change_cursor(session)
+
+def reset_change_cursor(session, floor):
+    """Move the cursor past floor and mark it as a resync point.
+
+    After a restore the counter holds its value from the backup, so it is
+    pushed past the pre-restore value to keep cursors moving forward.
+    """
+    value = max(floor, read_change_cursor(session) or 0) + 1
+    session.execute(
+        change_counter.update()
+        .where(change_counter.c.id == CHANGE_CURSOR)
+        .values(value=value)
+    )
+    session.execute(change_counter.delete().where(change_counter.c.id == RESET_CURSOR))
+    session.execute(change_counter.insert().values(id=RESET_CURSOR, value=value))
+    session.commit()
+    return value
+
+@event.listens_for(Session, 'before_flush')
+def stamp_changes(session, flush_context, instances):
+    changed = [obj for obj in session.new if isinstance(obj, ChangeTracked)]
+    changed += [obj for obj in session.dirty
+                if isinstance(obj, ChangeTracked) and session.is_modified(obj)]
+    deleted = any(isinstance(obj, ChangeTracked) for obj in session.deleted)
+    if not changed and not deleted:
+        return
+    
+    # Deletes leave no row to stamp but still move the cursor forward
+    seq = next_change_seq(session)
+    now = datetime.utcnow()
+    for obj in changed:
+        obj.change_seq = seq
+        obj.updated_at = now
+
+class User(ChangeTracked, db.Model):
     __tablename__ = 'users'
     
     id = db.Column(db.Integer, primary_key=True)
@@ -46,7 +114,7 @@ class User(db.Model):
             }
         }
 
-class Team(db.Model):
+class Team(ChangeTracked, db.Model):
     __tablename__ = 'teams'
     
     id = db.Column(db.Integer, primary_key=True)
@@ -57,7 +125,7 @@ class Team(db.Model):
     # Relationships
     scores = db.relationship('Score', backref='team', lazy=True)
 
-class Criteria(db.Model):
+class Criteria(ChangeTracked, db.Model):
     __tablename__ = 'criterias'  # FIXED: Changed from _tablename_ to __tablename__
     
     id = db.Column(db.Integer, primary_key=True)
@@ -71,7 +139,7 @@ class Criteria(db.Model):
     # Relationships
     scores = db.relationship('Score', backref='criteria', lazy=True)
 
-class Score(db.Model):
+class Score(ChangeTracked, db.Model):
     __tablename__ = 'scores'
     
     id = db.Column(db.Integer, primary_key=True)
@@ -88,3 +156,32 @@ class Score(db.Model):
     __table_args__ = (
         db.UniqueConstraint('judge_id', 'team_id', 'criteria_id', name='_judge_team_criteria_uc'),
     )
+
+class ScoreEvent(db.Model):
+    """Append-only log of every change made to a score.
+
+    previous_score is recorded so aggregated totals can be rolled forward
+    from a checkpoint without re-reading earlier events.
+    """
+    __tablename__ = 'score_events'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    action = db.Column(db.String(10), nullable=False)  # create, update, delete or baseline
+    judge_id = db.Column(db.Integer, nullable=False)
+    team_id = db.Column(db.Integer, nullable=False)
+    criteria_id = db.Column(db.Integer, nullable=False)
+    score = db.Column(db.Float)
+    previous_score = db.Column(db.Float)
+    notes = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+class ScoreCheckpoint(db.Model):
+    """Aggregated score totals after replaying events up to last_event_id"""
+    __tablename__ = 'score_checkpoints'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    last_event_id = db.Column(db.Integer, nullable=False)
+    last_event_at = db.Column(db.DateTime, nullable=False, index=True)
+    # JSON object of "team_id:criteria_id" -> [score sum, score count]
+    state = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
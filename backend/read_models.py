@@ -0,0 +1,65 @@
+"""Read-side queries that select only the columns a response needs.
+
+Rows come back as small namedtuples instead of ORM objects, so reads skip
+identity-map bookkeeping and relationship loading.
+"""
+from collections import namedtuple
+
+from models import db, user_criteria, User, Team, Criteria, Score
+from score_log import results_from_state
+
+TeamRow = namedtuple('TeamRow', 'id name description created_at')
+CriteriaRow = namedtuple('CriteriaRow', 'id name max_score weight_percentage')
+UserRow = namedtuple('UserRow', 'id username is_admin created_at')
+ScoreRow = namedtuple('ScoreRow', 'id team_id criteria_id score notes')
+
+
+def fetch_teams():
+    rows = db.session.execute(
+        db.select(Team.id, Team.name, Team.description, Team.created_at)
+    )
+    return [TeamRow._make(row) for row in rows]
+
+
+def fetch_active_criteria():
+    rows = db.session.execute(
+        db.select(Criteria.id, Criteria.name, Criteria.max_score, Criteria.weight_percentage)
+        .where(Criteria.is_active == True)
+    )
+    return [CriteriaRow._make(row) for row in rows]
+
+
+def fetch_judge_scores(judge_id):
+    rows = db.session.execute(
+        db.select(Score.id, Score.team_id, Score.criteria_id, Score.score, Score.notes)
+        .where(Score.judge_id == judge_id)
+    )
+    return [ScoreRow._make(row) for row in rows]
+
+
+def fetch_users():
+    """All users and their assigned criteria ids, in two queries"""
+    users = [UserRow._make(row) for row in db.session.execute(
+        db.select(User.id, User.username, User.is_admin, User.created_at)
+    )]
+
+    assigned = {}
+    for user_id, criteria_id in db.session.execute(
+        db.select(user_criteria.c.user_id, user_criteria.c.criteria_id)
+        .order_by(user_criteria.c.user_id, user_criteria.c.criteria_id)
+    ):
+        assigned.setdefault(user_id, []).append(criteria_id)
+    return users, assigned
+
+
+def fetch_results():
+    """The /api/results payload from one aggregate query per table"""
+    state = {
+        f"{team_id}:{criteria_id}": [total, count]
+        for team_id, criteria_id, total, count in db.session.execute(
+            db.select(Score.team_id, Score.criteria_id,
+                      db.func.sum(Score.score), db.func.count(Score.id))
+            .group_by(Score.team_id, Score.criteria_id)
+        )
+    }
+    return results_from_state(state, fetch_teams(), fetch_active_criteria())
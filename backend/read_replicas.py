@@ -0,0 +1,163 @@
+import threading
+import time
+
+from flask import g, has_request_context, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica picked for the current request.
+
+    Anything that writes - a flush, pending changes, or a non-SELECT
+    statement - still goes to the primary. A statement that fails on the
+    replica marks it down and is retried once on the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context() and 'read_router' in g:
+            engine = g.read_router.read_engine()
+            if (engine is not None
+                    and not self._flushing
+                    and not (self.new or self.dirty or self.deleted)
+                    and (clause is None or getattr(clause, 'is_select', False))):
+                g.replica_used = engine
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _with_fallback(self, method, *args, **kwargs):
+        if not has_request_context() or 'read_router' not in g:
+            return method(*args, **kwargs)
+
+        g.pop('replica_used', None)
+        try:
+            return method(*args, **kwargs)
+        except DBAPIError as e:
+            engine = g.pop('replica_used', None)
+            if engine is None:
+                raise
+            print(f"Read replica query failed, retrying on primary: {str(e)}")
+            g.read_router.mark_down(engine)
+            # Only reads reach the replica, so nothing pending is lost
+            self.rollback()
+            return method(*args, **kwargs)
+
+    def execute(self, *args, **kwargs):
+        return self._with_fallback(super().execute, *args, **kwargs)
+
+    def scalar(self, *args, **kwargs):
+        return self._with_fallback(super().scalar, *args, **kwargs)
+
+    def scalars(self, *args, **kwargs):
+        return self._with_fallback(super().scalars, *args, **kwargs)
+
+
+class ReadReplicaRouter:
+    """Routes GET requests to read replicas configured in SQLALCHEMY_BINDS.
+
+    Replicas are used round-robin. A judge who has just written is kept on the
+    primary for READ_REPLICA_STICKY_SECONDS so they see their own scores, and
+    a replica that fails its health check or a query is skipped for
+    READ_REPLICA_RETRY_SECONDS. A passing health check is also trusted for
+    that long, so replicas are not probed on every request. Stickiness is
+    tracked per process. The replica is only picked once a request first
+    queries the database, so requests that never touch it never touch a
+    replica either.
+    """
+
+    def __init__(self, db, app=None):
+        self.db = db
+        self.replica_keys = []
+        self._turn = 0
+        self._down_until = {}
+        self._healthy_until = {}
+        self._recent_writers = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.replica_keys = sorted(
+            key for key in app.config.get('SQLALCHEMY_BINDS') or {}
+            if key.startswith('replica_')
+        )
+        if not self.replica_keys:
+            return
+
+        self.sticky_seconds = app.config.get('READ_REPLICA_STICKY_SECONDS', 10)
+        self.retry_seconds = app.config.get('READ_REPLICA_RETRY_SECONDS', 30)
+        app.before_request(self._mark_request)
+        app.after_request(self._remember_writer)
+        print(f"Read replicas enabled: {', '.join(self.replica_keys)}")
+
+    def _current_identity(self):
+        try:
+            verify_jwt_in_request(optional=True)
+            return get_jwt_identity()
+        except Exception:
+            return None
+
+    def _mark_request(self):
+        if request.method in ('GET', 'HEAD'):
+            g.read_router = self
+
+    def read_engine(self):
+        """Replica engine for the current request, or None for the primary"""
+        if 'read_engine' not in g:
+            g.read_engine = self._choose_engine()
+        return g.read_engine
+
+    def _choose_engine(self):
+        identity = self._current_identity()
+        now = time.monotonic()
+        with self._lock:
+            if identity is not None and self._recent_writers.get(identity, 0) > now:
+                return None
+            # Start one further along each time, trying the rest in order
+            start = self._turn % len(self.replica_keys)
+            self._turn += 1
+        candidates = self.replica_keys[start:] + self.replica_keys[:start]
+
+        for key in candidates:
+            if self._down_until.get(key, 0) > now:
+                continue
+            engine = self.db.engines[key]
+            if self._healthy_until.get(key, 0) > now:
+                return engine
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text('SELECT 1'))
+            except Exception as e:
+                print(f"Read replica {key} unavailable, falling back: {str(e)}")
+                self._down_until[key] = now + self.retry_seconds
+                continue
+            self._healthy_until[key] = now + self.retry_seconds
+            return engine
+        return None
+
+    def mark_down(self, engine):
+        """Stop using a replica that failed, and send this request to the primary"""
+        now = time.monotonic()
+        for key in self.replica_keys:
+            if self.db.engines[key] is engine:
+                self._down_until[key] = now + self.retry_seconds
+                self._healthy_until.pop(key, None)
+        if has_request_context():
+            g.read_engine = None
+
+    def _remember_writer(self, response):
+        if request.method in ('GET', 'HEAD', 'OPTIONS') or response.status_code >= 400:
+            return response
+
+        identity = self._current_identity()
+        if identity is not None:
+            now = time.monotonic()
+            with self._lock:
+                self._recent_writers[identity] = now + self.sticky_seconds
+                # Drop expired entries so the map stays the size of active judges
+                for key, until in list(self._recent_writers.items()):
+                    if until <= now:
+                        del self._recent_writers[key]
+        return response
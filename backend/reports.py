@@ -0,0 +1,253 @@
+import json
+import multiprocessing
+import os
+import re
+import threading
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from html import escape
+
+from models import db, User, Team, Criteria, Score
+from score_log import results_from_state
+
+
+def collect_report_data():
+    """Feedback for every team, ranked, using a fixed number of queries.
+
+    Returns plain dicts so they can be handed to worker processes.
+    """
+    teams = Team.query.all()
+    criterias = Criteria.query.filter_by(is_active=True).all()
+    active_ids = [c.id for c in criterias]
+
+    rows = db.session.query(Score, User.username).outerjoin(
+        User, Score.judge_id == User.id
+    ).filter(Score.criteria_id.in_(active_ids)).order_by(Score.id).all()
+
+    state = {}
+    feedback = {}
+    for score, judge_name in rows:
+        key = f"{score.team_id}:{score.criteria_id}"
+        total, count = state.get(key, [0.0, 0])
+        state[key] = [total + score.score, count + 1]
+        feedback.setdefault(key, []).append({
+            'judge_name': judge_name or 'Unknown',
+            'score': score.score,
+            'notes': score.notes,
+            'created_at': score.created_at.isoformat()
+        })
+
+    teams_by_id = {t.id: t for t in teams}
+    reports = []
+    for rank, result in enumerate(results_from_state(state, teams, criterias), start=1):
+        team = teams_by_id[result['team_id']]
+        criteria_feedback = []
+        for criteria in criterias:
+            key = f"{team.id}:{criteria.id}"
+            if key not in feedback:
+                continue
+            total, count = state[key]
+            criteria_feedback.append({
+                'criteria_name': criteria.name,
+                'criteria_description': criteria.description,
+                'max_score': criteria.max_score,
+                'weight_percentage': criteria.weight_percentage,
+                'average_score': total / count,
+                'judge_feedback': feedback[key]
+            })
+
+        reports.append({
+            'team_id': team.id,
+            'team_name': team.name,
+            'team_description': team.description,
+            'rank': rank,
+            'team_count': len(teams),
+            'total_percentage': result['total_percentage'],
+            'criteria_feedback': criteria_feedback
+        })
+    return reports
+
+
+def report_filename(report):
+    slug = re.sub(r'[^a-z0-9]+', '-', report['team_name'].lower()).strip('-') or 'team'
+    return f"{report['rank']:03d}-{slug}-{report['team_id']}.html"
+
+
+def render_team_report(report):
+    """Render one team's feedback to a standalone HTML page.
+
+    Runs in a worker process, so it only uses the dict it is given.
+    """
+    sections = []
+    for item in report['criteria_feedback']:
+        judges = ''.join(
+            f"<tr><td>{escape(j['judge_name'])}</td>"
+            f"<td>{j['score']:g} / {item['max_score']:g}</td>"
+            f"<td>{escape(j['notes'] or '')}</td></tr>"
+            for j in item['judge_feedback']
+        )
+        sections.append(f"""
+<h2>{escape(item['criteria_name'])}</h2>
+<p class="muted">{escape(item['criteria_description'] or '')}</p>
+<p>Average: <strong>{item['average_score']:.2f} / {item['max_score']:g}</strong>
+ &middot; Weight: {item['weight_percentage']:g}%</p>
+<table>
+<tr><th>Judge</th><th>Score</th><th>Comments</th></tr>
+{judges}
+</table>""")
+
+    body = ''.join(sections) or '<p>No scores were submitted for this team.</p>'
+    html = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{escape(report['team_name'])} - Judging Feedback</title>
+<style>
+body {{ font-family: sans-serif; max-width: 800px; margin: 2em auto; color: #222; }}
+table {{ border-collapse: collapse; width: 100%; margin-bottom: 1.5em; }}
+th, td {{ border: 1px solid #ddd; padding: 6px 8px; text-align: left; vertical-align: top; }}
+th {{ background: #f4f4f4; }}
+.muted {{ color: #666; }}
+</style>
+</head>
+<body>
+<h1>{escape(report['team_name'])}</h1>
+<p class="muted">{escape(report['team_description'] or '')}</p>
+<p>Rank: <strong>{report['rank']} of {report['team_count']}</strong>
+ &middot; Total: <strong>{report['total_percentage']:.2f}%</strong></p>
+{body}
+</body>
+</html>
+"""
+    return report_filename(report), html
+
+
+def render_index(reports):
+    rows = ''.join(
+        f"<tr><td>{r['rank']}</td>"
+        f"<td><a href=\"{escape(report_filename(r))}\">{escape(r['team_name'])}</a></td>"
+        f"<td>{r['total_percentage']:.2f}%</td></tr>"
+        for r in reports
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Team Feedback Reports</title></head>
+<body>
+<h1>Team Feedback Reports</h1>
+<table>
+<tr><th>Rank</th><th>Team</th><th>Total</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+class ReportJob:
+    """Renders all team reports into one zip in a background thread.
+
+    Progress is written to <job_id>.json next to the zip so any worker
+    process can answer status requests.
+    """
+
+    def __init__(self, app, job_id=None):
+        self.app = app
+        self.job_id = job_id or uuid.uuid4().hex
+        self.directory = app.config.get('REPORTS_DIR') or os.path.join(app.instance_path, 'reports')
+        self.workers = app.config.get('REPORT_WORKERS', 2)
+        self.keep = app.config.get('REPORT_KEEP', 10)
+        os.makedirs(self.directory, exist_ok=True)
+        self.status = {
+            'job_id': self.job_id,
+            'status': 'queued',
+            'total': 0,
+            'completed': 0,
+            'error': None,
+            'created_at': datetime.utcnow().isoformat(),
+            'finished_at': None
+        }
+        self._save()
+
+    @property
+    def zip_path(self):
+        return os.path.join(self.directory, f'{self.job_id}.zip')
+
+    def _save(self, **changes):
+        self.status.update(changes)
+        path = status_path(self.directory, self.job_id)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.status, f)
+        os.replace(path + '.tmp', path)
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name=f'report-job-{self.job_id}', daemon=True)
+        thread.start()
+        return thread
+
+    def run(self):
+        try:
+            with self.app.app_context():
+                reports = collect_report_data()
+                db.session.remove()
+            self._save(status='running', total=len(reports))
+
+            partial_path = self.zip_path + '.part'
+            # spawn rather than fork: this runs alongside the server's threads
+            context = multiprocessing.get_context('spawn')
+            with zipfile.ZipFile(partial_path, 'w', zipfile.ZIP_DEFLATED) as archive, \
+                    ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+                archive.writestr('index.html', render_index(reports))
+                futures = [pool.submit(render_team_report, r) for r in reports]
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    filename, html = future.result()
+                    archive.writestr(filename, html)
+                    self._save(completed=completed)
+            os.replace(partial_path, self.zip_path)
+
+            self._save(status='complete', finished_at=datetime.utcnow().isoformat())
+        except Exception as e:
+            print(f"Error in report job {self.job_id}: {str(e)}")
+            self._save(status='failed', error=str(e), finished_at=datetime.utcnow().isoformat())
+
+        try:
+            prune_jobs(self.directory, self.keep)
+        except Exception as e:
+            print(f"Error pruning report jobs: {str(e)}")
+
+
+def status_path(directory, job_id):
+    return os.path.join(directory, f'{job_id}.json')
+
+
+def prune_jobs(directory, keep):
+    """Delete the files of all but the newest `keep` finished jobs.
+
+    Queued and running jobs are left alone.
+    """
+    finished = []
+    for name in os.listdir(directory):
+        job_id, extension = os.path.splitext(name)
+        if extension != '.json':
+            continue
+        status = load_status(directory, job_id)
+        if status and status['status'] in ('complete', 'failed'):
+            finished.append((status['created_at'], job_id))
+
+    for _, job_id in sorted(finished, reverse=True)[keep:]:
+        for suffix in ('.json', '.zip', '.zip.part'):
+            path = os.path.join(directory, job_id + suffix)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def load_status(directory, job_id):
+    """Status of a job, or None if there is no such job"""
+    if not re.fullmatch(r'[0-9a-f]{32}', job_id):
+        return None
+    try:
+        with open(status_path(directory, job_id)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
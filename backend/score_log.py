@@ -0,0 +1,177 @@
+import json
+from datetime import datetime
+
+from models import db, Score, ScoreEvent, ScoreCheckpoint
+
+
+def score_event(action, score, previous_score=None):
+    """Build the log entry for a create, update or delete of a Score"""
+    return ScoreEvent(
+        action=action,
+        judge_id=score.judge_id,
+        team_id=score.team_id,
+        criteria_id=score.criteria_id,
+        score=score.score if action != 'delete' else None,
+        previous_score=previous_score,
+        notes=score.notes
+    )
+
+
+def apply_event(state, event):
+    """Roll one event into a {"team_id:criteria_id": [sum, count]} state"""
+    key = f"{event.team_id}:{event.criteria_id}"
+    total, count = state.get(key, [0.0, 0])
+
+    if event.action in ('create', 'baseline'):
+        total += event.score
+        count += 1
+    elif event.action == 'update':
+        total += event.score - event.previous_score
+    elif event.action == 'delete':
+        total -= event.previous_score
+        count -= 1
+
+    if count > 0:
+        state[key] = [total, count]
+    else:
+        state.pop(key, None)
+    return state
+
+
+def backfill_events():
+    """Seed the log with a baseline event for every score that predates it.
+
+    Earlier edits were never recorded, so baselines are stamped with the
+    backfill time and history before that point is unknown.
+    """
+    if ScoreEvent.query.first() is not None:
+        return 0
+
+    scores = Score.query.all()
+    now = datetime.utcnow()
+    db.session.add_all([
+        ScoreEvent(
+            action='baseline',
+            judge_id=s.judge_id,
+            team_id=s.team_id,
+            criteria_id=s.criteria_id,
+            score=s.score,
+            notes=s.notes,
+            created_at=now
+        ) for s in scores
+    ])
+    db.session.commit()
+    return len(scores)
+
+
+def baseline_at():
+    """When the log was seeded from existing scores, or None if it never was"""
+    event = ScoreEvent.query.filter_by(action='baseline').order_by(ScoreEvent.id).first()
+    return event.created_at if event else None
+
+
+def latest_checkpoint(at=None):
+    query = ScoreCheckpoint.query
+    if at is not None:
+        query = query.filter(ScoreCheckpoint.last_event_at <= at)
+    return query.order_by(ScoreCheckpoint.last_event_id.desc()).first()
+
+
+def create_checkpoint():
+    """Fold every event since the last checkpoint into a new one.
+
+    Folding by id is only safe because writers insert events after taking
+    the change counter lock, so event ids commit in increasing order.
+    Returns None when no events arrived since the last checkpoint.
+    """
+    checkpoint = latest_checkpoint()
+    state = json.loads(checkpoint.state) if checkpoint else {}
+    last_event_id = checkpoint.last_event_id if checkpoint else 0
+
+    events = ScoreEvent.query.filter(
+        ScoreEvent.id > last_event_id
+    ).order_by(ScoreEvent.id).all()
+
+    if not events:
+        return None
+
+    for event in events:
+        apply_event(state, event)
+
+    checkpoint = ScoreCheckpoint(
+        last_event_id=events[-1].id,
+        last_event_at=max(e.created_at for e in events),
+        state=json.dumps(state)
+    )
+    db.session.add(checkpoint)
+    db.session.commit()
+    return checkpoint
+
+
+def maybe_checkpoint(interval):
+    """Create a checkpoint once interval events have piled up since the last one"""
+    try:
+        checkpoint = latest_checkpoint()
+        last_event_id = checkpoint.last_event_id if checkpoint else 0
+        pending = ScoreEvent.query.filter(ScoreEvent.id > last_event_id).count()
+        if pending >= interval:
+            create_checkpoint()
+    except Exception as e:
+        # A missed checkpoint only makes replay slower, never wrong
+        db.session.rollback()
+        print(f"Error creating score checkpoint: {str(e)}")
+
+
+def state_at(at):
+    """Aggregated score totals as they stood at the given time.
+
+    Starts from the newest checkpoint taken before that time and replays
+    only the events written after it.
+    """
+    checkpoint = latest_checkpoint(at)
+    state = json.loads(checkpoint.state) if checkpoint else {}
+    last_event_id = checkpoint.last_event_id if checkpoint else 0
+
+    events = ScoreEvent.query.filter(
+        ScoreEvent.id > last_event_id,
+        ScoreEvent.created_at <= at
+    ).order_by(ScoreEvent.id).all()
+
+    for event in events:
+        apply_event(state, event)
+    return state, checkpoint, len(events)
+
+
+def results_from_state(state, teams, criterias):
+    """Build the /api/results payload from aggregated totals"""
+    results = []
+    for team in teams:
+        team_scores = {}
+        weighted_total = 0
+
+        for criteria in criterias:
+            total, count = state.get(f"{team.id}:{criteria.id}", [0.0, 0])
+
+            if count:
+                avg_score = total / count
+                percentage_earned = (avg_score / criteria.max_score) * criteria.weight_percentage
+                weighted_total += percentage_earned
+
+                team_scores[criteria.name] = {
+                    'average': avg_score,
+                    'max': criteria.max_score,
+                    'weight_percentage': criteria.weight_percentage,
+                    'percentage_earned': percentage_earned,
+                    'count': count
+                }
+
+        results.append({
+            'team_id': team.id,
+            'team_name': team.name,
+            'scores': team_scores,
+            'total_percentage': weighted_total,
+            'max_possible': 100.0
+        })
+
+    results.sort(key=lambda x: x['total_percentage'], reverse=True)
+    return results
@@ -20,7 +20,7 @@ import {
   TextField,
 } from '@mui/material';
 import { useNavigate } from 'react-router-dom';
-import api from '../services/api';
+import api, { getJudgeSheet } from '../services/api';
 
 export default function JudgingPage() {
   const [teams, setTeams] = useState([]);
@@ -33,44 +33,28 @@ export default function JudgingPage() {
   const [snackbar, setSnackbar] = useState({ open: false, message: '', severity: 'success' });
   const navigate = useNavigate();
 
-  const loadScores = async () => {
-    try {
-      const scoresRes = await api.get('/api/scores/me');
-      const userScores = {};
-      const userNotes = {};
-      
-      scoresRes.data.forEach(score => {
-        if (!userScores[score.team_id]) {
-          userScores[score.team_id] = {};
-          userNotes[score.team_id] = {};
-        }
-        userScores[score.team_id][score.criteria_id] = score.score;
-        userNotes[score.team_id][score.criteria_id] = score.notes || '';
-      });
-      
-      setScores(userScores);
-      setNotes(userNotes);
-    } catch (error) {
-      console.error('Error loading scores:', error);
-      showSnackbar('Failed to load scores', 'error');
-    }
-  };
-
   useEffect(() => {
     const fetchData = async () => {
       try {
         setLoading(true);
-        const [teamsRes, criteriaRes] = await Promise.all([
-          api.get('/api/teams'),
-          api.get('/api/criteria')
-        ]);
-        
-        setTeams(teamsRes.data);
-        setCriteria(criteriaRes.data);
-        
-        // Load existing scores
-        await loadScores();
-        
+        // Teams, assigned criteria and existing scores in one round trip
+        const { data } = await getJudgeSheet();
+
+        const userScores = {};
+        const userNotes = {};
+        Object.entries(data.scores).forEach(([teamId, teamScores]) => {
+          userScores[teamId] = {};
+          userNotes[teamId] = {};
+          Object.entries(teamScores).forEach(([criteriaId, entry]) => {
+            userScores[teamId][criteriaId] = entry.score;
+            userNotes[teamId][criteriaId] = entry.notes || '';
+          });
+        });
+
+        setTeams(data.teams);
+        setCriteria(data.criteria);
+        setScores(userScores);
+        setNotes(userNotes);
       } catch (error) {
         showSnackbar('Failed to load data', 'error');
       } finally {
@@ -15,7 +15,7 @@ import {
   TablePagination,
   Chip,
 } from '@mui/material';
-import api from '../services/api';
+import { getJudgeSheet } from '../services/api';
 
 export default function MyScoresPage() {
   const [scores, setScores] = useState([]);
@@ -29,16 +29,37 @@ export default function MyScoresPage() {
     const fetchData = async () => {
       try {
         setLoading(true);
-        // Fetch all necessary data in parallel
-        const [scoresRes, teamsRes, criteriaRes] = await Promise.all([
-          api.get('/api/scores/me'),
-          api.get('/api/teams'),
-          api.get('/api/criteria')
-        ]);
+        // Teams, criteria and scores in one round trip
+        const { data } = await getJudgeSheet();
+
+        const flatScores = [];
+        const scoredCriteria = {};
+        Object.entries(data.scores).forEach(([teamId, teamScores]) => {
+          Object.entries(teamScores).forEach(([criteriaId, entry]) => {
+            flatScores.push({
+              id: entry.id,
+              team_id: parseInt(teamId),
+              criteria_id: parseInt(criteriaId),
+              score: entry.score,
+              notes: entry.notes
+            });
+            // Deactivated criteria stay hidden, as they are everywhere else
+            if (entry.criteria_is_active) {
+              scoredCriteria[criteriaId] = {
+                id: parseInt(criteriaId),
+                name: entry.criteria_name,
+                max_score: entry.criteria_max_score
+              };
+            }
+          });
+        });
 
-        setScores(scoresRes.data);
-        setTeams(teamsRes.data);
-        setCriteria(criteriaRes.data);
+        setScores(flatScores);
+        setTeams(data.teams);
+        setCriteria([
+          ...data.criteria,
+          ...Object.values(scoredCriteria).filter(sc => !data.criteria.some(c => c.id === sc.id))
+        ]);
       } catch (error) {
         console.error('Error loading data:', error);
       } finally {
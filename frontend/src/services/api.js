@@ -77,9 +77,32 @@ export const getTeamScores = (teamId) => {
   return api.get(`/api/scores/team/${teamId}`);
 };
 
+// Judge API
+export const getJudgeSheet = () => {
+  return api.get('/api/judge/sheet');
+};
+
+// Sync API
+export const syncChanges = (since = 0) => {
+  return api.get('/api/sync', { params: { since } });
+};
+
 // Results API
 export const getResults = () => {
   return api.get('/api/results');
 };
 
+// Feedback reports API
+export const startReportJob = () => {
+  return api.post('/api/reports');
+};
+
+export const getReportJob = (jobId) => {
+  return api.get(`/api/reports/${jobId}`);
+};
+
+export const downloadReports = (jobId) => {
+  return api.get(`/api/reports/${jobId}/download`, { responseType: 'blob' });
+};
+
 export default api;